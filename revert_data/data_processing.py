@@ -1,5 +1,9 @@
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import datetime, timezone
 import math
+import sys
+from operator import itemgetter
 import seniority_processing
 
 TIME_INDEX = 0
@@ -7,26 +11,58 @@ REVERT_INDEX = 1
 VERSION_INDEX = 2
 NAME_INDEX = 3
 
-def parse_content(file_path):
+def parse_time(timestamp):
     '''
-    Parses the content of the file and returns a list of lists.
+    Parses the timestamp of an edit from the file into seconds since the epoch.
 
     Parameters:
-    file_path (str): The path to the file to be parsed.
+    timestamp (str): The date and time of an edit in UTC, formatted as "%Y-%m-%d %H:%M:%S".
 
     Returns:
-    content (list): A list of lists containing the parsed content.
+    int: The time of the edit in seconds since the epoch.
+    '''
+    # fromisoformat reads "%Y-%m-%d %H:%M:%S" directly and is much faster than strptime
+    return int(datetime.fromisoformat(timestamp).replace(tzinfo=timezone.utc).timestamp())
+
+def format_time(seconds):
+    '''
+    Formats a time parsed by parse_time for display.
+
+    Parameters:
+    seconds (int): The time of an edit in seconds since the epoch.
+
+    Returns:
+    str: The date and time of the edit in UTC, formatted as "%Y-%m-%d %H:%M:%S".
+    '''
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+def iter_content(file_path):
+    '''
+    Parses the content of the file one line at a time, yielding each row as a list.
+
+    Parameters:
+    file_path (str): The path to the file to be parsed.
+
+    Yields:
+    row (list): A list containing the time, revert flag, version and editor of an edit.
     '''
     with open(file_path) as f:
         next(f)  # skip header
-        content = [x.strip().split()[1:] for x in f]
+        for _, date, time, revert, version, name in map(str.split, f):
+            # Intern editor names so each one is stored once however many edits it made
+            yield [parse_time(date + ' ' + time), revert, int(version), sys.intern(name)]
 
-    for element in content:
-        element[0] = datetime.strptime(' '.join(element[:2]), "%Y-%m-%d %H:%M:%S")
-        element[1:] = element[2:]
-        element[2] = int(element[VERSION_INDEX])
+def parse_content(file_path):
+    '''
+    Parses the content of the file and returns a list of lists.
+
+    Parameters:
+    file_path (str): The path to the file to be parsed.
 
-    return content
+    Returns:
+    content (list): A list of lists containing the parsed content.
+    '''
+    return list(iter_content(file_path))
 
 def process_edit_data(content_sorted):
     '''
@@ -36,17 +72,18 @@ def process_edit_data(content_sorted):
     content_sorted (list): A list of lists containing the parsed content, sorted by time.
     
     Returns:
-    edit_dic (dict): A dictionary containing the seniority of each editor at each edit.
+    edit_dic (dict): A dictionary mapping each editor to a dictionary of their seniority keyed by edit time.
     '''
-    edit_count = {}
-    edit_dic = {}
+    edit_count = defaultdict(int)
+    edit_dic = defaultdict(dict)
 
     for edit in content_sorted:
         name = edit[NAME_INDEX]
         # Set the edit count of the editor starting from 1
-        edit_count[name] = edit_count.get(name, 0) + 1
-        seniority = math.log(edit_count[name],10)
-        edit_dic.setdefault(name, []).append({'time': edit[TIME_INDEX], "seniority": seniority})
+        edit_count[name] += 1
+        seniority = math.log10(edit_count[name])
+        # Keep the first edit when an editor has several at the same second
+        edit_dic[name].setdefault(edit[TIME_INDEX], seniority)
 
     return edit_dic
 
@@ -65,18 +102,33 @@ def find_revert_data(content, potential_reverts, edit_dic, max_num_versions):
     '''
     revert_data = {}
 
+    # Positions of the rows holding each version, in content order, and of every row by identity
+    version_positions = defaultdict(list)
+    index_of = {}
+
+    for i, row in enumerate(content):
+        version_positions[row[VERSION_INDEX]].append(i)
+        index_of[id(row)] = i
+
     for potential_revert in potential_reverts:
-        max_num_iterations = content.index(potential_revert) + (max_num_versions - potential_revert[VERSION_INDEX])
+        index = index_of[id(potential_revert)]
+        version = potential_revert[VERSION_INDEX]
+        positions = version_positions[version]
 
-        for i in range(content.index(potential_revert) + 1, max_num_iterations):
-            if content[i][VERSION_INDEX] == potential_revert[VERSION_INDEX]:
-                potential_reverted = content[i - 1]
+        # The first later row with a matching version is the restored edit
+        next_position = bisect_right(positions, index)
+        if next_position == len(positions):
+            continue  # no restored edit, continue to the next potential_revert
 
-                if potential_reverted[NAME_INDEX] == potential_revert[NAME_INDEX]:
-                    break  # not a valid revert, continue to the next potential_revert
-                else:  # Valid revert found
-                    revert_data = process_revert_data(potential_revert, potential_reverted, edit_dic, revert_data)
-                    break  # revert found, continue to the next potential_revert
+        # Rows up to max_num_versions - version + 1 below the revert can hold the restored edit
+        restored_index = positions[next_position]
+        if restored_index > index + (max_num_versions - version) + 1:
+            continue  # outside the window, continue to the next potential_revert
+
+        potential_reverted = content[restored_index - 1]
+
+        if potential_reverted[NAME_INDEX] != potential_revert[NAME_INDEX]:  # Valid revert found
+            revert_data = process_revert_data(potential_revert, potential_reverted, edit_dic, revert_data)
 
     return revert_data
 
@@ -93,41 +145,69 @@ def process_revert_data(potential_revert, potential_reverted, edit_dic, revert_d
     Returns:
     revert_data (dict): A dictionary containing the revert data for each potential revert.
     '''
-    revert_seniority_data = edit_dic[potential_revert[NAME_INDEX]]
-    reverted_seniority_data = edit_dic[potential_reverted[NAME_INDEX]]
-
-    reverter_entry = next(edit for edit in revert_seniority_data if edit['time'] == potential_revert[TIME_INDEX])
-    reverted_entry = next(edit for edit in reverted_seniority_data if edit['time'] == potential_reverted[TIME_INDEX])
+    reverter_seniority = edit_dic[potential_revert[NAME_INDEX]][potential_revert[TIME_INDEX]]
+    reverted_seniority = edit_dic[potential_reverted[NAME_INDEX]][potential_reverted[TIME_INDEX]]
 
     revert_data.setdefault(potential_revert[NAME_INDEX], []).append({
         'reverted': potential_reverted[NAME_INDEX],
         'time': potential_revert[TIME_INDEX],
-        'seniority_reverter': reverter_entry['seniority'],
-        'seniority_reverted': reverted_entry['seniority']
+        'seniority_reverter': reverter_seniority,
+        'seniority_reverted': reverted_seniority
     })
 
     return revert_data
 
-def process_reverter(reverter_key, reverter_data, revert_data, ab_ba_seniorities, considered_reverts):
+def group_reverts_by_target(revert_data):
+    '''
+    Groups the reverts conducted by each reverter by the editor they reverted.
+
+    Parameters:
+    revert_data (dict): A dictionary containing the revert data for each potential revert.
+
+    Returns:
+    reverts_by_target (dict): A dictionary mapping each reverter to the times and (position, revert) pairs
+    of their reverts, sorted by time and keyed by the reverted editor.
+    '''
+    reverts_by_target = {}
+
+    for reverter_key, reverter_data in revert_data.items():
+        targets = {}
+        for position, revert in enumerate(reverter_data):
+            targets.setdefault(revert['reverted'], []).append((revert['time'], position, revert))
+
+        # Sort by time so the reverts inside a time window can be found by bisection
+        for reverted, reverts in targets.items():
+            reverts.sort(key=itemgetter(0, 1))
+            targets[reverted] = ([time for time, _, _ in reverts], [(position, revert) for _, position, revert in reverts])
+
+        reverts_by_target[reverter_key] = targets
+
+    return reverts_by_target
+
+def process_reverter(reverter_key, reverter_data, reverts_by_target, ab_ba_seniorities, considered_reverts):
     '''
     Processes the reverts conducted by a reverter and finds AB-BA seniorities.
 
     Parameters:
     reverter_key (str): The name of the reverter.
     reverter_data (list): A list containing the revert data for the reverter.
-    revert_data (dict): A dictionary containing the revert data for each potential revert.
+    reverts_by_target (dict): A dictionary containing the reverts of each reverter keyed by the reverted editor.
     ab_ba_seniorities (list): A list containing the AB-BA seniorities.
-    considered_reverts (list): A list containing the considered reverts.
+    considered_reverts (set): A set containing the ids of the considered reverts.
 
     Returns:
     ab_ba_seniorities (list): A list containing the AB-BA seniorities.
-    considered_reverts (list): A list containing the considered reverts.
+    considered_reverts (set): A set containing the ids of the considered reverts.
     '''
     for revert in reverter_data:
-        if revert['reverted'] in revert_data:
-            reverted = revert['reverted']
-            for entry in revert_data[reverted]:
-                seniority_processing.find_ab_ba_seniorities(entry, revert, ab_ba_seniorities, reverter_key, considered_reverts)
+        # Only the reverted's reverts of our reverter within the AB-BA window can complete an AB-BA motif
+        times, reverts = reverts_by_target.get(revert['reverted'], {}).get(reverter_key, ((), ()))
+        start = bisect_left(times, revert['time'])
+        end = bisect_right(times, revert['time'] + seniority_processing.AB_BA_WINDOW)
+
+        # Check the candidates in their original order so the same revert is matched first
+        for _, entry in sorted(reverts[start:end]):
+            seniority_processing.find_ab_ba_seniorities(entry, revert, ab_ba_seniorities, reverter_key, considered_reverts)
 
 def process_all_revert_data(revert_data):
     '''
@@ -138,12 +218,13 @@ def process_all_revert_data(revert_data):
 
     Returns:
     ab_ba_seniorities (list): A list containing the AB-BA seniorities.
-    considered_reverts (list): A list containing the considered reverts.
+    considered_reverts (set): A set containing the ids of the considered reverts.
     '''
     ab_ba_seniorities = list()
-    considered_reverts = list()
+    considered_reverts = set()
+    reverts_by_target = group_reverts_by_target(revert_data)
 
     for reverter_key, reverter_data in revert_data.items():
-        process_reverter(reverter_key, reverter_data, revert_data, ab_ba_seniorities, considered_reverts)
+        process_reverter(reverter_key, reverter_data, reverts_by_target, ab_ba_seniorities, considered_reverts)
 
     return ab_ba_seniorities, considered_reverts
\ No newline at end of file
@@ -1,4 +1,5 @@
-from datetime import timedelta
+# Maximum time in seconds between A reverting B and B reverting A for the pair to form an AB-BA motif
+AB_BA_WINDOW = 24 * 60 * 60
 
 def calculate_seniority_differences(revert):
     '''
@@ -18,7 +19,7 @@ def get_non_ab_ba_seniorities(revert_data, considered_reverts):
 
     Parameters:
     revert_data (dict): Dictionary of revert data
-    considered_reverts (set): Set of considered reverts
+    considered_reverts (set): Set of ids of considered reverts
 
     Returns:
     list: List of seniority differences for non-ab-ba reverts
@@ -27,7 +28,7 @@ def get_non_ab_ba_seniorities(revert_data, considered_reverts):
 
     for reverter in revert_data:
         for revert in revert_data[reverter]:
-            if revert not in considered_reverts:
+            if id(revert) not in considered_reverts:
                 differences.append(calculate_seniority_differences(revert))
 
     return differences
@@ -41,7 +42,7 @@ def find_ab_ba_seniorities(reverted_edge, reverters_edge, ab_ba_seniorities, key
     reverters_edge (dict): Edge from reverter
     ab_ba_seniorities (list): List of seniority differences for AB-BA reverts
     key (str): Name of reverter
-    considered_reverts (list): Set of considered reverts
+    considered_reverts (set): Set of ids of considered reverts
     '''
     # Find the time difference between the reverted's revert and our reverter's revert
     time_difference = reverted_edge['time'] - reverters_edge['time']
@@ -50,12 +51,12 @@ def find_ab_ba_seniorities(reverted_edge, reverters_edge, ab_ba_seniorities, key
         #the time difference is within 24 hours
         #the reverted's edge indicates it is reverting the reverter
         #these reverts have not already been considered
-    if (timedelta(0) <= time_difference <= timedelta(hours=24)) and \
+    if (0 <= time_difference <= AB_BA_WINDOW) and \
         (reverted_edge['reverted'] == key) and \
-            (reverters_edge not in considered_reverts) and \
-                (reverted_edge not in considered_reverts):
+            (id(reverters_edge) not in considered_reverts) and \
+                (id(reverted_edge) not in considered_reverts):
         
-        considered_reverts.append(reverters_edge)
-        considered_reverts.append(reverted_edge)
+        considered_reverts.add(id(reverters_edge))
+        considered_reverts.add(id(reverted_edge))
         
         ab_ba_seniorities.append(calculate_seniority_differences(reverters_edge))
\ No newline at end of file
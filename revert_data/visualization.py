@@ -1,5 +1,7 @@
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.ticker import ScalarFormatter
+from data_processing import format_time
 
 def plot_seniority(non_ab_ba_seniorities, ab_ba_seniorities):
     """
@@ -11,9 +13,16 @@ def plot_seniority(non_ab_ba_seniorities, ab_ba_seniorities):
     ab_ba_sequnces (list): list of seniority differences for ab-ba reverts
     """
 
-    plt.hist(non_ab_ba_seniorities, bins=50, edgecolor='k', alpha=0.65, label = "All Other Reverts")
+    # Bin both datasets once on shared edges so their bars line up
+    bin_edges = np.histogram_bin_edges(np.concatenate([non_ab_ba_seniorities, ab_ba_seniorities]), bins=50)
+    bin_widths = np.diff(bin_edges)
 
-    plt.hist(ab_ba_seniorities, bins=50, edgecolor='k', alpha=0.65, label='AB-BA Sequences')
+    non_ab_ba_counts, _ = np.histogram(non_ab_ba_seniorities, bins=bin_edges)
+    ab_ba_counts, _ = np.histogram(ab_ba_seniorities, bins=bin_edges)
+
+    plt.bar(bin_edges[:-1], non_ab_ba_counts, width=bin_widths, align='edge', edgecolor='k', alpha=0.65, label = "All Other Reverts")
+
+    plt.bar(bin_edges[:-1], ab_ba_counts, width=bin_widths, align='edge', edgecolor='k', alpha=0.65, label='AB-BA Sequences')
 
     plt.xlabel('Difference in seniority')
 
@@ -36,24 +45,19 @@ def print_network_data(revert_data):
     Prints the number of nodes and edges in the network
     and the first 5 data points, a new line for each one
     '''
-    nodes_count = set()
-
-    for reverter, reverted_data in revert_data.items():
-        nodes_count.add(reverter)
-        
-        for item in reverted_data:
-            nodes_count.add(item['reverted'])
-
+    # Count nodes and edges in a single pass over the network
+    nodes_count = set(revert_data)
     edges_count = 0
 
-    for key in revert_data:
-        edges_count += len(revert_data[key])
+    for reverted_data in revert_data.values():
+        edges_count += len(reverted_data)
+        nodes_count.update(item['reverted'] for item in reverted_data)
 
     print("The first 5 data points are:")
     first_key, first_values = next(iter(revert_data.items()))
     print(f"{first_key}:")
     for item in first_values[:5]:
-        print("\t" + str(item))
+        print("\t" + str({**item, 'time': format_time(item['time'])}))
 
     #print the number of nodes and edges
     print("\nThe number of nodes in the network are: " + str(len(nodes_count)))